@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from functools import partial
+from collections import abc
 from typing import Optional, Union, TYPE_CHECKING
 
 import sqlalchemy as sa
@@ -78,12 +79,23 @@ class Query(QueryExecutor):
         """
         return self.pager_op.limit
 
-    def page_links(self) -> PageLinks:
+    def page_links(self, prefetch: Optional[abc.Callable[[str], None]] = None) -> PageLinks:
         """ Get links to the previous and next page
 
         These values are opaque cursors that you can feed to "before" or "after" to get to the corresponding page
+
+        Args:
+            prefetch: A callback to invoke with the "next" cursor, if there is a next page.
+                Clients tend to go through pages sequentially, so you can use it to schedule loading the next page
+                in the background (e.g. with a thread pool) and keep the results in a bounded cache keyed by the cursor.
+                Query has no connection of its own and does no caching: this is up to your application.
         """
-        return self.pager_op.get_page_links()
+        links = self.pager_op.get_page_links()
+
+        if prefetch is not None and links.next is not None:
+            prefetch(links.next)
+
+        return links
 
     def filter(self, *conditions: sa.sql.ClauseElement):
         """ Apply filtering to this Query. 
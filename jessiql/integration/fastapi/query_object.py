@@ -59,7 +59,8 @@ def query_object(*,
         exc.QueryObjectError
     """
     # Empty?
-    if not select and not filter and not sort and not skip and not limit:
+    # NOTE: truthiness, not `is None`: empty strings (`?select=`) and zeros (`?limit=0`) mean "not given"
+    if not select and not filter and not sort and not skip and not limit and not before and not after:
         return None
 
     # Query Object dict
@@ -7,14 +7,15 @@ It goes through the Query tree, and:
 """
 
 from typing import Union, Any, Optional
-from collections import abc
+from collections import abc, deque
 
 import graphql
 
 from jessiql import QueryObjectDict, QueryObject
+from jessiql.util.funcy import memoize_by_identity
 
-from .query_object_argument import get_query_argument_name_for
-from .selection import collect_fields
+from .query_object_argument import get_query_argument_name_for, unwrap_type
+from .selection import collect_fields, get_single_field_node
 
 
 def query_object_for(info: graphql.GraphQLResolveInfo, nested_path: abc.Iterable[str] = (), *,
@@ -48,12 +49,11 @@ def query_object_for(info: graphql.GraphQLResolveInfo, nested_path: abc.Iterable
         def resolve_user(obj, info):
             names = query_object_from_info(info, 'User')
     """
-    assert len(info.field_nodes) == 1  # I've never seen a selection of > 1 field
-    field_node = list(info.field_nodes)[0]  # we cannot do [0] directly on its type: `Collection`
+    field_node = get_single_field_node(info)
     parent_type = info.parent_type
 
     # Get selected field definition
-    selected_field_def = graphql.utilities.type_info.get_field_def(info.schema, parent_type, field_node)
+    selected_field_def = get_field_def(info.schema, parent_type, field_node)
 
     # Get the Query Object dict
     query_object_dict = graphql_query_object_dict_from_query(
@@ -104,6 +104,103 @@ def graphql_query_object_dict_from_query(
         KeyError: a type is not found by name
         RuntimeError: fragment was used, but `runtime_type` was not provided
     """
+    # Prepare the top-level Query Object Dict: the one we're going to return
+    query_object, selected_field, selected_field_type = _prepare_query_object_dict_for_field(
+        variable_values,
+        selected_field_def=selected_field_def,
+        selected_field=selected_field,
+        nested_path=nested_path,
+        query_argument=query_argument,
+        query_object_type_name=query_object_type_name,
+    )
+
+    # Walk the tree of selected fields level by level.
+    # Every item is a Query Object Dict to populate, and the selected field that it is populated from.
+    # We use a queue rather than recursion: deeply nested queries don't pay for Python frames.
+    work_queue: deque[tuple[QueryObjectDict, graphql.FieldNode, graphql.GraphQLObjectType, Union[str, graphql.GraphQLObjectType, None]]]
+    work_queue = deque([(query_object, selected_field, selected_field_type, runtime_type)])
+
+    while work_queue:
+        current_query_object, selected_field, selected_field_type, runtime_type = work_queue.popleft()
+
+        # Collect all fields at this level
+        fields = collect_fields(
+            schema,
+            fragments,
+            variable_values,
+            selected_field.selection_set,  # type: ignore[arg-type]
+            runtime_type=runtime_type
+        )
+
+        # Nothing selected, or a type that has no fields (scalar, enum): nothing to walk into
+        if not fields or not isinstance(selected_field_type, (graphql.GraphQLObjectType, graphql.GraphQLInterfaceType)):
+            continue
+
+        # Lists to populate: bound once per level, not looked up for every field
+        select_append = current_query_object['select'].append  # type: ignore[union-attr]
+        join = current_query_object['join']
+
+        # Field definitions of this level's type. NOTE: `GraphQLObjectType.fields` is a cached property, but still a descriptor call
+        fields_by_name: dict[str, graphql.GraphQLField] = selected_field_type.fields
+
+        # Iterate every field on this level, see if there's a place for them in the Query Object
+        # Note that `field_name` may not be the original field name: it may be aliased by the query!
+        for field_name, field_list in fields.items():
+            for field in field_list:
+                # `field_name`: field name as given by the user, possibly aliased
+                # `field.name.value`: field name as defined in the schema
+
+                # Schema field name
+                schema_field_name = field.name.value
+
+                # Get field definition from the schema
+                try:
+                    field_def: graphql.type.definition.GraphQLField = fields_by_name[schema_field_name]
+                except KeyError:
+                    # It fails when the user gives a bad field name.
+                    # We will not fail. Let GraphQL fail for us.
+                    continue
+
+                # How to include this field?
+                # If it has a selection, then we include it as a relation -- unless it's decorated with @jessiql_select
+                # NOTE: the directive is only looked up for fields with a selection: for the rest, it makes no difference
+                has_selection = field.selection_set and field.selection_set.selections
+
+                if not has_selection or has_jessiql_select_directive(field_def):
+                    select_append(schema_field_name)
+                else:
+                    related_query_object, related_field, related_field_type = _prepare_query_object_dict_for_field(
+                        variable_values,
+                        selected_field_def=field_def,
+                        selected_field=field,
+                        query_object_type_name=query_object_type_name,
+                    )
+                    join[schema_field_name] = related_query_object  # type: ignore[index]
+
+                    # Populate it later
+                    # The runtime type of a sub-query is known when the field returns an object type: use it to resolve fragments.
+                    # TODO: for unions and interfaces, runtime type cannot be resolved. This means that fragments cannot be used.
+                    #   How to fix? callable() that feeds the type? @directives?
+                    related_runtime_type = related_field_type if isinstance(related_field_type, graphql.GraphQLObjectType) else None
+                    work_queue.append((related_query_object, related_field, related_field_type, related_runtime_type))
+
+    return query_object
+
+
+def _prepare_query_object_dict_for_field(
+        variable_values: dict[str, Any], *,
+        selected_field_def: graphql.GraphQLField,
+        selected_field: graphql.FieldNode,
+        nested_path: abc.Iterable[str] = (),
+        query_argument: Optional[str] = None,
+        query_object_type_name: str = None,
+) -> tuple[QueryObjectDict, graphql.FieldNode, graphql.GraphQLObjectType]:
+    """ Prepare a Query Object Dict for a selected field: without "select" and "join" populated yet
+
+    Returns:
+        (Query Object Dict, selected field, selected field type): the field & type to take the selected fields from.
+        They differ from the input when `nested_path` is used.
+    """
     # Get the query argument name and the Query Object Input
     query_arg_name = query_argument or get_query_argument_name_for(selected_field_def, query_object_type_name=query_object_type_name)
     if query_arg_name is None:
@@ -112,7 +209,7 @@ def graphql_query_object_dict_from_query(
         query_arg = get_query_argument_value_for(selected_field, query_arg_name, variable_values) or {}
 
     # unwrap lists & nonnulls, deal with raw types
-    selected_field_type: graphql.type.definition.GraphQLObjectType = unwrap_type(selected_field_def.type)  # type: ignore[assignment]
+    selected_field_type: graphql.type.definition.GraphQLObjectType = unwrap_field_type(selected_field_def)  # type: ignore[assignment]
 
     # Nested path?
     # This section works in cases when `query` is on one level, but the actual object is on a lower level.
@@ -128,62 +225,18 @@ def graphql_query_object_dict_from_query(
         # We will not fail. Let GraphQL fail for us.
         pass
 
-    # Prepare the Query Object Dict we're going to return
-    query_object: QueryObjectDict = {
-        'select': [],
-        'join': {},
-        **query_arg  # type: ignore[misc]
-    }
-
-    # Collect all fields at this level
-    fields = collect_fields(
-        schema,
-        fragments,
-        variable_values,
-        selected_field.selection_set,  # type: ignore[arg-type]
-        runtime_type=runtime_type
-    )
-
-    # Iterate every field on this level, see if there's a place for them in the Query Object
-    # Note that `field_name` may not be the original field name: it may be aliased by the query!
-    for field_name, field_list in fields.items():
-        for field in field_list:
-            # `field_name`: field name as given by the user, possibly aliased
-            # `field.name.value`: field name as defined in the schema
-
-            # Schema field name
-            schema_field_name = field.name.value
-
-            # Get field definition from the schema
-            try:
-                field_def: graphql.type.definition.GraphQLField = selected_field_type.fields[schema_field_name]
-            except KeyError:
-                # It fails when the user gives a bad field name.
-                # We will not fail. Let GraphQL fail for us.
-                continue
-
-            # How to include this field?
-            # If it has a selection, then we include it as a relation -- unless it's decorated with @jessiql_select
-            has_selection = field.selection_set and field.selection_set.selections
-            jessiql_select = get_directive('jessiql_select', field_def.ast_node)
-
-            if not has_selection or jessiql_select:
-                query_object['select'].append(schema_field_name)  # type: ignore[union-attr]
-            else:
-                query_object['join'][schema_field_name] = graphql_query_object_dict_from_query(  # type: ignore[index]
-                    schema,
-                    fragments,
-                    variable_values,
-                    selected_field_def=field_def,
-                    selected_field=field,
-                    # TODO: runtime type currently cannot be resolved for sub-queries. This means that fragments cannot be used.
-                    #   How to fix? callable() that feeds the type? @directives?
-                    runtime_type=None,
-                    query_object_type_name=query_object_type_name,
-                )
-
-    return query_object
+    # Prepare the Query Object Dict
+    # Most fields have no query argument at all: don't bother merging an empty dict.
+    # Otherwise, copy the argument and only add the keys it lacks. Keys given by the argument win.
+    query_object: QueryObjectDict
+    if not query_arg:
+        query_object = {'select': [], 'join': {}}
+    else:
+        query_object = dict(query_arg)  # type: ignore[assignment]
+        query_object.setdefault('select', [])
+        query_object.setdefault('join', {})
 
+    return query_object, selected_field, selected_field_type
 
 
 def get_query_argument_value_for(field: graphql.FieldNode, query_arg_name: str, variables: dict[str, Any]) -> Optional[dict]:
@@ -198,13 +251,22 @@ def get_query_argument_value_for(field: graphql.FieldNode, query_arg_name: str,
         The value of the "query" argument, or None if not provided.
         Note it will be a partial Query Object Dict: no "select" nor "join" fields are available here.
     """
-    # Arguments are an array, we have to iterate and find the one with the right name
+    # Arguments are an array, we have to iterate and find the one with the right name.
+    # NOTE: no index by name is built here: every field node is looked up exactly once per query,
+    # and fields typically have a handful of arguments. Building a dict would cost more than the scan.
     for argument in field.arguments:
         if argument.name.value == query_arg_name:
-            return graphql.value_from_ast_untyped(argument.value, variables)
+            value_node = argument.value
+
+            # Fast path: `query: $query` is simply a variable lookup
+            if isinstance(value_node, graphql.VariableNode):
+                return variables.get(value_node.name.value)
+
+            # Inline literals: convert the AST into Python values
+            return graphql.value_from_ast_untyped(value_node, variables)
+
     # Nothing found
-    else:
-        return None
+    return None
 
 
 def descend_into_field_with(path: abc.Iterable[str], *, selected_field: graphql.FieldNode, field_type: graphql.GraphQLObjectType):
@@ -224,21 +286,41 @@ def descend_into_field_with(path: abc.Iterable[str], *, selected_field: graphql.
             raise ValueError(f"Field {selected_field.name.value!r} has no selections. Nesting cannot descent. Is your `nested_path` correct?")
 
         # Descend into: selected fields
-        try:
-            selected_field = next(sel_node
-                                  for sel_node in selected_field.selection_set.selections
-                                  if (isinstance(sel_node, graphql.FieldNode) and
-                                      sel_node.name.value == name and
-                                      selected_field.selection_set is not None))
-        except StopIteration:
+        # NOTE: a plain loop: every selection set is only looked into once, so building a {name: node} index won't pay off
+        for sel_node in selected_field.selection_set.selections:
+            if isinstance(sel_node, graphql.FieldNode) and sel_node.name.value == name:
+                selected_field = sel_node
+                break
+        else:
             raise KeyError(selected_field)
 
         # Descend into: schema
-        field_type = unwrap_type(field_type.fields[name].type)
+        field_type = unwrap_field_type(field_type.fields[name])  # type: ignore[assignment]
 
     return selected_field, field_type
 
 
+def get_field_def(schema: graphql.GraphQLSchema, parent_type: graphql.GraphQLObjectType, field_node: graphql.FieldNode) -> graphql.GraphQLField:
+    """ Get the definition of a selected field
+
+    Same as `graphql.utilities.type_info.get_field_def()`, but goes directly to `parent_type.fields`,
+    which is a dict computed once per type. Only introspection fields (__typename, etc) are left to graphql-core.
+    """
+    try:
+        return parent_type.fields[field_node.name.value]
+    except KeyError:
+        return graphql.utilities.type_info.get_field_def(schema, parent_type, field_node)  # type: ignore[return-value]
+
+
+@memoize_by_identity
+def has_jessiql_select_directive(field_def: graphql.GraphQLField) -> bool:
+    """ Check whether the field is decorated with @jessiql_select
+
+    The schema is static, so the answer is memoized per field definition.
+    """
+    return get_directive('jessiql_select', field_def.ast_node) is not None
+
+
 # copied from: apiens.tools.graphql.ast
 def get_directive(directive_name: str, node: graphql.FieldDefinitionNode = None) -> Optional[graphql.DirectiveNode]:
     """ Get a directive from a field by name """
@@ -251,4 +333,10 @@ def get_directive(directive_name: str, node: graphql.FieldDefinitionNode = None)
     else:
         return None
 
-unwrap_type = graphql.get_named_type  # Unwrap GraphQL wrapper types (List, NonNull, etc)
+@memoize_by_identity
+def unwrap_field_type(field_def: graphql.GraphQLField) -> graphql.GraphQLNamedType:
+    """ Get the field's type, unwrapped from List, NonNull, etc
+
+    The schema is static, so the result is memoized per field definition.
+    """
+    return unwrap_type(field_def.type)
@@ -7,6 +7,8 @@ It is found by its type: "QueryObjectInput" (defined as const QUERY_OBJECT_INPUT
 import graphql
 from typing import Optional
 
+from jessiql.util.funcy import memoize_by_identity
+
 
 # Input type name for JessiQL Query
 # In JessiQL, the query object argument can have any name. It's located by its type.
@@ -41,17 +43,29 @@ def get_query_argument_name_for(field_def: graphql.GraphQLField, *, query_object
     query_object_input_name = query_object_type_name or QUERY_OBJECT_INPUT_NAME
 
     # Find it
+    return _find_argument_name_by_type(field_def, query_object_input_name)
+
+
+@memoize_by_identity
+def _find_argument_name_by_type(field_def: graphql.GraphQLField, type_name: str) -> Optional[str]:
+    """ Find the name of the first argument of the given type
+
+    The schema is static, so the result is memoized per field definition.
+    """
     for arg_name, arg in field_def.args.items():
         field_type = unwrap_type(arg.type)
-        if field_type.name == query_object_input_name:  # type: ignore[union-attr]
+        if field_type.name == type_name:  # type: ignore[union-attr]
             return arg_name
     else:
         return None
 
 
-def has_query_argument(field_def: graphql.GraphQLField) -> bool:
-    """ Test whether the field has a `query` argument (found by its type) """
-    return get_query_argument_name_for(field_def) is not None
+def has_query_argument(field_def: graphql.GraphQLField, *, query_object_type_name: str = None) -> bool:
+    """ Test whether the field has a `query` argument (found by its type)
+
+    Shares the memoized lookup with get_query_argument_name_for()
+    """
+    return get_query_argument_name_for(field_def, query_object_type_name=query_object_type_name) is not None
 
 
 unwrap_type = graphql.get_named_type  # Unwrap GraphQL wrapper types (List, NonNull, etc)
@@ -15,15 +15,14 @@ from typing import Union, Any, Optional
 #   > runtime_type = get_operation_root_type(self.schema, operation)
 
 
-def selected(info: graphql.GraphQLResolveInfo, runtime_type: Union[str, graphql.GraphQLObjectType] = None) -> abc.Iterator[str]:
+def selected(info: graphql.GraphQLResolveInfo, runtime_type: Union[str, graphql.GraphQLObjectType] = None) -> list[str]:
     """ Shortcut: selected_field_names() when used in a resolve function
 
     Example:
         def resolve_user(obj, info):
             names = selected(info, 'User')
     """
-    assert len(info.field_nodes) == 1  # I've never seen a selection of > 1 field
-    field_node = list(info.field_nodes)[0]  # we cannot do [0] directly on its type: `Collection`
+    field_node = get_single_field_node(info)
 
     return selected_field_names(
         info.schema,
@@ -46,8 +45,7 @@ def selected_naive(info: graphql.GraphQLResolveInfo) -> abc.Iterator[str]:
                 'count': 10 if 'count' in field_names(info) else None,
             }
     """
-    assert len(info.field_nodes) == 1  # I've never seen a selection of > 1 field
-    field_node = list(info.field_nodes)[0]  # we cannot do [0] directly on its type: `Collection`
+    field_node = get_single_field_node(info)
 
     return selected_field_names_naive(field_node.selection_set)  # type: ignore[arg-type]
 
@@ -57,7 +55,7 @@ def selected_field_names(
         fragments: dict[str, graphql.FragmentDefinitionNode],
         variable_values: dict[str, Any],
         selection_set: graphql.SelectionSetNode, *,
-        runtime_type: Union[str, graphql.GraphQLObjectType] = None) -> abc.Iterator[str]:
+        runtime_type: Union[str, graphql.GraphQLObjectType] = None) -> list[str]:
     """ Get the list of field names selected at the current level
 
     Supports:
@@ -123,11 +121,16 @@ def selected_field_names(
     )
 
     # Get field names
-    return (
+    # NOTE: a list, not a generator: every caller consumes it fully, and a list comprehension is cheaper to drain
+    return [
         field.name.value  # NOTE: return the original field name, even if it's aliased
         for fields in fields_map.values()
         for field in fields
-    )
+    ]
+
+
+# Fragment nodes: FragmentSpreadNode (`... fragmentName`) and InlineFragmentNode (`... on Droid { }`)
+_FRAGMENT_NODE_TYPES = (graphql.FragmentSpreadNode, graphql.InlineFragmentNode)
 
 
 def selected_field_names_naive(selection_set: graphql.SelectionSetNode) -> abc.Iterator[str]:
@@ -170,7 +173,7 @@ def selected_field_names_naive(selection_set: graphql.SelectionSetNode) -> abc.I
             # NOTE: in case of an alias, it still returns the actual field name, not the alias!
             yield node.name.value
         # Fragment spread (`... fragmentName`) and inline fragment (`... on Droid { }`)
-        elif isinstance(node, (graphql.FragmentSpreadNode, graphql.InlineFragmentNode)):
+        elif isinstance(node, _FRAGMENT_NODE_TYPES):
             raise RuntimeError('GraphQL query contains fragments but this particular query does not support them '
                                'because a naïve parsing method is used.')
         # Something new
@@ -198,21 +201,39 @@ def selected_fields_tree(
             {'tags': ['id', 'name']}
         ]
     """
-    fields_map = collect_fields(
-        schema,
-        fragments,
-        variable_values,
-        selection_set,
-        runtime_type=runtime_type
-    )
+    result: list[Union[str, dict[str, list]]] = []
+
+    # Walk the tree with an explicit stack rather than recursion.
+    # Every item is a selection set to collect, and the list to put its fields into.
+    stack: list[tuple[graphql.SelectionSetNode, list, Union[str, graphql.GraphQLObjectType, None]]]
+    stack = [(selection_set, result, runtime_type)]
+
+    while stack:
+        current_selection_set, current_result, current_runtime_type = stack.pop()
+
+        fields_map = collect_fields(
+            schema,
+            fragments,
+            variable_values,
+            current_selection_set,
+            runtime_type=current_runtime_type
+        )
 
-    return [
-        field.name.value if not field.selection_set else {
-            field.name.value: selected_fields_tree(schema, fragments, variable_values, field.selection_set, runtime_type=None)
-        }
-        for fields in fields_map.values()
-        for field in fields
-    ]
+        for fields in fields_map.values():
+            for field in fields:
+                field_name = field.name.value
+                field_selection_set = field.selection_set
+
+                # Leaf field
+                if not field_selection_set:
+                    current_result.append(field_name)
+                # Sub-query: populate its list later
+                else:
+                    sub_result: list = []
+                    current_result.append({field_name: sub_result})
+                    stack.append((field_selection_set, sub_result, None))
+
+    return result
 
 
 def collect_fields(
@@ -272,6 +293,27 @@ class GraphqlFieldCollector(graphql.ExecutionContext):
         self.variable_values = variable_values
 
 
+def get_single_field_node(info: graphql.GraphQLResolveInfo) -> graphql.FieldNode:
+    """ Get the one field node that the resolver is resolving
+
+    Raises:
+        RuntimeError: the field is selected multiple times and GraphQL has merged the selections
+    """
+    field_nodes = info.field_nodes
+    field_node = field_nodes[0]  # type: ignore[index]  # typed as `Collection`, but is always a sequence
+
+    # I've never seen a selection of > 1 field. Not an `assert`: it must hold with `python -O` as well
+    if len(field_nodes) > 1:
+        raise RuntimeError(f'Field {field_node.name.value!r} is selected multiple times: this is not supported')
+
+    return field_node
+
+
+# A placeholder type for when `runtime_type` is not given.
+# Use an object that would fail GraphQL internal tests: fragments that depend on a type won't match it.
+_PLACEHOLDER_RUNTIME_TYPE = graphql.GraphQLObjectType('_x_temp', [])  # type: ignore[arg-type]
+
+
 def _compat_collect_fields(
     schema: graphql.GraphQLSchema,
     fragments: dict[str, graphql.FragmentDefinitionNode],
@@ -296,7 +338,7 @@ def _compat_collect_fields(
         fields_map = execution_context.collect_fields(  # type: ignore[attr-defined]
             # Use an object that would fail GraphQL internal tests
             # runtime_type=runtime_type or None,
-            runtime_type=runtime_type or graphql.GraphQLObjectType('_x_temp', []),  # type: ignore[arg-type]
+            runtime_type=runtime_type or _PLACEHOLDER_RUNTIME_TYPE,  # type: ignore[arg-type]
             selection_set=selection_set,
             fields={},  # (out) memo
             visited_fragment_names=visited_fragment_names,  # out
@@ -311,7 +353,7 @@ def _compat_collect_fields(
             schema=schema,
             fragments=fragments,
             variable_values=variable_values,
-            runtime_type=runtime_type or graphql.GraphQLObjectType('_x_temp', []),  # type: ignore[arg-type]
+            runtime_type=runtime_type or _PLACEHOLDER_RUNTIME_TYPE,  # type: ignore[arg-type]
             selection_set=selection_set,
             fields=fields_map,  # (out) memo
             visited_fragment_names=visited_fragment_names,  # out
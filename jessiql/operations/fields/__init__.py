@@ -6,7 +6,7 @@ from .base import Selectable, Sortable, Filterable
 from .column import ColumnHandler
 from .property import PropertyHandler
 from .hybrid_property import HybridPropertyHandler
-from .relation import RelationHandler
+from .relation import RelationHandler, _resolve_relation_chain
 
 
 # TODO: this is probably not the best place for this code, but anyway, here it is. For now.
@@ -35,34 +35,92 @@ ALL_HANDLERS = (
 )
 
 
-from typing import Optional, TypeVar
+from functools import lru_cache
+from typing import Optional
+import sqlalchemy as sa
+import sqlalchemy.orm
+
 from jessiql import exc, sainfo
 from jessiql.typing import SAModelOrAlias
 
 
 def choose_selectable_handler_or_fail(name: str, sub_path: Optional[tuple[str, ...]], Model: SAModelOrAlias) -> Selectable:
     """ Choose a handler for a field that will be selected """
-    return _choose_handler_or_fail(name, sub_path, Model, context=NameContext.SELECT, HandlerType=Selectable)
+    return _choose_handler_or_fail(name, sub_path, Model, context=NameContext.SELECT)  # type: ignore[return-value]
 
 
 def choose_sortable_handler_or_fail(name: str, sub_path: Optional[tuple[str, ...]], Model: SAModelOrAlias) -> Sortable:
     """ Choose a handler for a field that will be sorted by """
-    return _choose_handler_or_fail(name, sub_path, Model, context=NameContext.SORT, HandlerType=Sortable)
+    return _choose_handler_or_fail(name, sub_path, Model, context=NameContext.SORT)  # type: ignore[return-value]
 
 
 def choose_filterable_handler_or_fail(name: str, sub_path: Optional[tuple[str, ...]], Model: SAModelOrAlias) -> Filterable:
     """ Choose a handler for a field that will be filtered by """
-    return _choose_handler_or_fail(name, sub_path, Model, context=NameContext.FILTER, HandlerType=Filterable)
-
-
-T = TypeVar('T')
+    return _choose_handler_or_fail(name, sub_path, Model, context=NameContext.FILTER)  # type: ignore[return-value]
 
 
 def _choose_handler_or_fail(name: str, sub_path: Optional[tuple[str, ...]], Model: SAModelOrAlias,
-                            context: NameContext, HandlerType: type[T]) -> T:
+                            context: NameContext) -> FieldHandlerBase:
     """ Given a field, find a handler that implements it. Otherwise, fail. """
-    for handler in ALL_HANDLERS:
-        if issubclass(handler, HandlerType) and handler.is_applicable(name, sub_path, Model, context=context):
-            return handler(name, sub_path, Model, context=context)  # type: ignore[return-value]
-    else:
-        raise exc.InvalidColumnError(sainfo.names.model_name(Model), name, where=context.value)
+    handler = _choose_handler_class_or_fail(name, sub_path, sainfo.models.unaliased_class(Model), context)
+    return handler(name, sub_path, Model, context=context)
+
+
+@lru_cache(maxsize=4096)
+def _choose_handler_class_or_fail(name: str, sub_path: Optional[tuple[str, ...]], Model: type,
+                                  context: NameContext) -> type[FieldHandlerBase]:
+    """ Given a field, find a handler class that implements it. Otherwise, fail.
+
+    Models are static, so the result is memoized: every model ends up with a table of field names to handler classes.
+    Failures are not cached: they raise.
+    The cache is dropped whenever SqlAlchemy configures new mappers: see invalidate_field_caches()
+    If you modify ALL_HANDLERS at runtime, call `index_handlers()`.
+    """
+    for handler in _HANDLERS_BY_CONTEXT[context]:
+        if handler.is_applicable(name, sub_path, Model, context=context):
+            return handler
+
+    # Nothing found
+    raise exc.InvalidColumnError(sainfo.names.model_name(Model), name, where=context.value)
+
+
+def invalidate_field_caches():
+    """ Drop everything that field handlers have memoized about models
+
+    Models are static... until new mappers get configured: e.g. a relationship is added with a backref,
+    or models are defined dynamically (tests, plugins).
+    This is called automatically when SqlAlchemy configures mappers.
+    """
+    _choose_handler_class_or_fail.cache_clear()
+    _resolve_relation_chain.cache_clear()
+    sainfo.models.unaliased_class.cache_clear()
+    sainfo.columns.resolve_column_by_name.cache_clear()
+
+    # NOTE: imported here: `select` imports this module
+    from jessiql.operations.select import _adapted_local_columns
+    _adapted_local_columns.cache_clear()
+
+
+sa.event.listen(sa.orm.Mapper, 'after_configured', invalidate_field_caches)
+
+
+# Handler classes that support each context, in the order of ALL_HANDLERS.
+# Handlers are static: so classes are matched against the context once, not for every field.
+_HANDLER_TYPE_BY_CONTEXT: dict[NameContext, type[FieldHandlerBase]] = {
+    NameContext.SELECT: Selectable,
+    NameContext.FILTER: Filterable,
+    NameContext.SORT: Sortable,
+}
+_HANDLERS_BY_CONTEXT: dict[NameContext, tuple[type[FieldHandlerBase], ...]] = {}
+
+
+def index_handlers():
+    """ Match ALL_HANDLERS against contexts. Call it if you've modified ALL_HANDLERS at runtime. """
+    _HANDLERS_BY_CONTEXT.update({
+        context: tuple(handler for handler in ALL_HANDLERS if issubclass(handler, HandlerType))
+        for context, HandlerType in _HANDLER_TYPE_BY_CONTEXT.items()
+    })
+    _choose_handler_class_or_fail.cache_clear()
+
+
+index_handlers()
@@ -21,7 +21,7 @@ class ColumnHandler(Selectable, Filterable, Sortable):
             return False
 
         # Context: no dot-notation is supported for SELECT
-        if context == context.SELECT and sub_path is not None:
+        if context is NameContext.SELECT and sub_path is not None:
             return False
 
         # Ok
@@ -60,10 +60,14 @@ class ColumnHandler(Selectable, Filterable, Sortable):
         if self.sub_path and not self.is_json:
             raise exc.QueryObjectError(f'Field "{self.name}" does not support dot-notation: not a JSON field')
 
-    __slots__ = 'context', 'name', 'sub_path', 'property', 'is_array', 'is_json'
+        # Remember the resolved attribute: (Model, attribute).
+        # NOTE: not annotated as a field: it's a cache, it should not take part in __eq__() and __repr__()
+        self._resolved = (Model, attribute)
+
+    __slots__ = 'context', 'name', 'sub_path', 'property', 'is_array', 'is_json', '_resolved'
 
     def select_columns(self, Model: SAModelOrAlias) -> abc.Iterator[sa.sql.ColumnElement]:
-        assert self.sub_path is None
+        # NOTE: `sub_path` is always None here: is_applicable() rejects dot-notation in the SELECT context
         yield self._refer_to(Model)
 
     def filter_by(self, Model: SAModelOrAlias) -> sa.sql.ColumnElement:
@@ -73,10 +77,13 @@ class ColumnHandler(Selectable, Filterable, Sortable):
         return self._refer_to(Model)
 
     def _refer_to(self, Model: SAModelOrAlias) -> sa.sql.ColumnElement:
-        expr = sainfo.columns.resolve_column_by_name(self.name, Model, where=self.context.value)
+        # Most often, we're referring to the very same Model (or alias) that the field was resolved against
+        resolved_Model, expr = self._resolved
+        if resolved_Model is not Model:
+            expr = sainfo.columns.resolve_column_by_name(self.name, Model, where=self.context.value)
+            self._resolved = (Model, expr)
 
-        if self.sub_path:
-            assert self.is_json
+        if self.sub_path:  # always a JSON field: __init__() makes sure of it
             expr = json_field_subpath_as_text(expr, self.sub_path)  # type: ignore[assignment]
 
         return expr
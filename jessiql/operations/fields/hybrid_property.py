@@ -53,7 +53,11 @@ class HybridPropertyHandler(Selectable, Filterable, Sortable):
         if sub_path is not None:
             raise exc.QueryObjectError(f'Field "{self.name}" does not support dot-notation yet: is a dynamic expression, not JSON')
 
-    __slots__ = 'context', 'name', 'property', 'is_array', 'is_json'
+        # Remember the property resolved against a Model (or alias): (Model, property). Is filled by _refer_to()
+        # NOTE: not annotated as a field: it's a cache, it should not take part in __eq__() and __repr__()
+        self._resolved: tuple[Optional[SAModelOrAlias], Optional[sa.ext.hybrid.hybrid_property]] = (None, None)
+
+    __slots__ = 'context', 'name', 'property', 'is_array', 'is_json', '_resolved'
 
     def select_columns(self, Model: SAModelOrAlias) -> abc.Iterator[sa.sql.ColumnElement]:
         yield self._refer_to(Model)
@@ -65,6 +69,11 @@ class HybridPropertyHandler(Selectable, Filterable, Sortable):
         return self._refer_to(Model)
 
     def _refer_to(self, Model: SAModelOrAlias) -> sa.sql.ColumnElement:
-        prop = sainfo.properties.resolve_hybrid_property_by_name(self.name, Model, where=self.context.value)
+        # select_columns(), filter_by() and sort_by() are all likely to refer to the very same Model (or alias)
+        resolved_Model, prop = self._resolved
+        if resolved_Model is not Model:
+            prop = sainfo.properties.resolve_hybrid_property_by_name(self.name, Model, where=self.context.value)
+            self._resolved = (Model, prop)
+
         # NOTE: in SqlAlchemy 1.3 a hybrid_property, when selected, gets name "anon_1". In 1.4, it gets a proper name automatically, but we still add a label() just to make sure
-        return prop.label(self.name)  # type: ignore[attr-defined]
+        return prop.label(self.name)  # type: ignore[union-attr, attr-defined]
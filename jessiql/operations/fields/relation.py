@@ -8,6 +8,7 @@ import sqlalchemy.orm
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 
 from jessiql import sainfo, exc
+from jessiql.sainfo.models import lru_cache_for_models
 from jessiql.typing import SAModelOrAlias
 from jessiql.util.sacompat import SA_13
 from .base import NameContext, Filterable, Sortable
@@ -24,7 +25,7 @@ class RelationHandler(Filterable, Sortable):
     @classmethod
     def is_applicable(cls, name: str, sub_path: Optional[tuple[str, ...]], Model: SAModelOrAlias, context: NameContext) -> bool:
         # Selecting is not supported: only filtering & sorting
-        if context == context.SELECT:
+        if context is NameContext.SELECT:
             return False
 
         # Type
@@ -81,11 +82,16 @@ class RelationHandler(Filterable, Sortable):
         self.is_array = sainfo.columns.is_array(related_attribute)
         self.is_json = sainfo.columns.is_json(related_attribute)
 
-    __slots__ = 'context', 'name', 'sub_path', 'property', 'is_array', 'is_json'
+        # Remember the related attribute: filter_by() would otherwise have to walk the path again.
+        # It's never aliased: _follow_subpath_to_the_final_attribute() descends into unaliased related models.
+        # NOTE: not annotated as a field: it's a cache, it should not take part in __eq__() and __repr__()
+        self._related_attribute = related_attribute
+
+    __slots__ = 'context', 'name', 'sub_path', 'property', 'is_array', 'is_json', '_related_attribute'
 
     def filter_by(self, Model: SAModelOrAlias) -> sa.sql.ColumnElement:
-        relation = sainfo.relations.resolve_relation_by_name(self.name, Model, where=self.context.value)
-        return _follow_subpath_to_the_final_attribute(relation, self.sub_path, where=self.context.value)
+        # The same for every Model alias: see __init__()
+        return self._related_attribute
 
     def filter_with(self, Model: SAModelOrAlias, expr: sa.sql.ColumnElement) -> sa.sql.ColumnElement:
         return _build_related_condition(Model, (self.name, *self.sub_path), where=self.context.value, final_expr=expr)
@@ -120,26 +126,19 @@ def _follow_subpath_to_the_final_attribute(attr: InstrumentedAttribute, sub_path
         The referenced attribute, be it a field, a relationship, or some sort of property.
         It's not aliased.
     """
-    # Nowhere to descend? Stop recursion.
-    if not sub_path:
-        return attr
-
-    # Get the next field name
-    field_name, remaining_sub_path = sub_path[0], sub_path[1:]
-
-    # Everything but the last element is a relationship
-    if not isinstance(attr.property, sa.orm.RelationshipProperty):
-        raise exc.InvalidRelationError(attr.parent.class_.__name__, field_name, where=where)
+    for field_name in sub_path:
+        # Everything but the last element is a relationship
+        if not isinstance(attr.property, sa.orm.RelationshipProperty):
+            raise exc.InvalidRelationError(attr.parent.class_.__name__, field_name, where=where)
 
-    # Get the related model and field
-    try:
+        # Get the related model and field
         related_model = attr.mapper.class_
-        related_attr = getattr(related_model, field_name)
-    except AttributeError:
-        raise exc.InvalidColumnError(related_model.__name__, field_name, where=where)
+        try:
+            attr = getattr(related_model, field_name)
+        except AttributeError:
+            raise exc.InvalidColumnError(related_model.__name__, field_name, where=where)
 
-    # Recurse
-    return _follow_subpath_to_the_final_attribute(related_attr, remaining_sub_path, where=where)
+    return attr
 
 
 def _build_related_condition(Model: SAModelOrAlias, sub_path: abc.Sequence[str], *, where: str, final_expr: sa.sql.ColumnElement) -> sa.sql.ColumnElement:
@@ -153,19 +152,32 @@ def _build_related_condition(Model: SAModelOrAlias, sub_path: abc.Sequence[str],
     """
     # The last element is a field name.
     # All the preceding elements are relationship names.
-    if len(sub_path) == 1:
-        return final_expr
-
-    # Descend into relations
-    relation_name, remaining_sub_path = sub_path[0], sub_path[1:]
-    relation = getattr(Model, relation_name)
-
-    # Recurse
-    related_model = relation.mapper.class_
-    expr = _build_related_condition(related_model, remaining_sub_path, where=where, final_expr=final_expr)
-
-    # Build condition
-    if relation.property.uselist:
-        return relation.any(expr)
-    else:
-        return relation.has(expr)
+    chain = _resolve_relation_chain(Model, tuple(sub_path[:-1]))
+
+    # Wrap the condition, inside out
+    expr = final_expr
+    for relation, uselist in reversed(chain):
+        if uselist:
+            expr = relation.any(expr)
+        else:
+            expr = relation.has(expr)
+
+    return expr
+
+
+@lru_cache_for_models(maxsize=4096)
+def _resolve_relation_chain(Model: SAModelOrAlias, relation_names: tuple[str, ...]) -> tuple[tuple[InstrumentedAttribute, bool], ...]:
+    """ Descend into relations: get every relationship attribute on the way, and whether it's a list
+
+    Models are static, so the result is memoized for model classes (not aliases).
+    The first relation is taken from `Model` itself, so it is aliased if `Model` is.
+
+    Returns:
+        [(relationship attribute, uselist), ...]
+    """
+    chain = []
+    for relation_name in relation_names:
+        relation = getattr(Model, relation_name)
+        chain.append((relation, relation.property.uselist))
+        Model = relation.mapper.class_
+    return tuple(chain)
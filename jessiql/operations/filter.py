@@ -1,5 +1,5 @@
 from collections import abc
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 import sqlalchemy as sa
 import sqlalchemy.sql.operators
@@ -22,11 +22,18 @@ class FilterOperation(Operation):
 
     def apply_to_statement(self, stmt: sa.sql.Select) -> sa.sql.Select:
         """ Modify the Select statement: add the WHERE clause """
+        # No conditions? Don't touch the statement
+        filter_conditions = self.query.filter.conditions
+        if not filter_conditions:
+            return stmt
+
         # Compile the conditions
-        conditions = (
-            self._compile_condition(condition)
-            for condition in self.query.filter.conditions
-        )
+        # NOTE: a list, not a generator: it's unpacked into arguments right away anyway
+        conditions = self._compile_conditions(filter_conditions)
+
+        # All conditions were empty: no WHERE clause
+        if not conditions:
+            return stmt
 
         # Add the WHERE clause
         stmt = stmt_filter(stmt, *conditions)
@@ -34,11 +41,22 @@ class FilterOperation(Operation):
         # Done
         return stmt
 
-    def _compile_condition(self, condition: FilterExpressionBase) -> sa.sql.ColumnElement:
+    def _compile_conditions(self, conditions: abc.Iterable[FilterExpressionBase]) -> list[sa.sql.ColumnElement]:
+        """ Generate SQL filter expressions for a list of conditions, leave out the empty ones """
+        return [
+            compiled
+            for compiled in map(self._compile_condition, conditions)
+            if compiled is not None
+        ]
+
+    def _compile_condition(self, condition: FilterExpressionBase) -> Optional[sa.sql.ColumnElement]:
         """ Generate a SQL filter expression for the condition
 
         Args:
             condition: a field expression (field == value) or a bool expression (x AND y AND z)
+
+        Returns:
+            The expression, or None when the condition is empty (e.g. `$and: []`) and adds no clause
         """
         # Field expressions
         if isinstance(condition, FieldFilterExpression):
@@ -96,7 +114,7 @@ class FilterOperation(Operation):
         filter_expr = condition.handler.filter_with(self.target_Model, filter_expr)
         return filter_expr
 
-    def _compile_boolean_conditions(self, condition: BooleanFilterExpression) -> sa.sql.ColumnElement:
+    def _compile_boolean_conditions(self, condition: BooleanFilterExpression) -> Optional[sa.sql.ColumnElement]:
         """ Generate an SQL statement for a boolean expression: e.g. "x AND y AND z"
 
         A boolean expression is represented by a class that encapsulates the following syntax:
@@ -106,30 +124,38 @@ class FilterOperation(Operation):
         # "$not" is special
         if condition.operator == '$not':
             # AND all clauses together
-            criterion = sql_anded_together([
-                self._compile_condition(c)
-                for c in condition.clauses
-            ])
+            criterion = sql_anded_together(self._compile_conditions(condition.clauses))
             # now negate all of them
             return sa.not_(criterion)
         # "$and", "$or", "$nor" share some steps so they're handled together
         else:
             # Compile expressions
-            criteria = [self._compile_condition(c) for c in condition.clauses]
+            criteria = self._compile_conditions(condition.clauses)
+
+            # No clauses: no condition at all. The parent skips it, and if nothing is left, no WHERE clause is added.
+            # "$and: []" and "$nor: []" impose no restriction.
+            # "$or: []" is treated the same way: deliberately so, because it has always returned every row.
+            # NOTE: an empty AND/OR must not reach SqlAlchemy: "$nor: []" would render an invalid "WHERE NOT"
+            if not criteria:
+                return None
 
             # Build an expression for $or and $nor
             # "nor" will later be finalized with a negation
             if condition.operator in ('$or', '$nor'):
-                cc = sa.or_(*criteria)
+                sa_operator = sa.or_
             # Build an expression for $and
             elif condition.operator == '$and':
-                cc = sa.and_(*criteria)
+                sa_operator = sa.and_
             # Oops
             else:
                 raise NotImplementedError(f'Unsupported boolean operator: {condition.operator}')
 
-            # Put parentheses around it when there are multiple clauses
-            cc = cc.self_group() if len(criteria) > 1 else cc  # type: ignore[assignment]
+            # A single clause is used as is: no need to wrap it into AND/OR
+            # Multiple clauses: put parentheses around them
+            if len(criteria) == 1:
+                cc = criteria[0]
+            else:
+                cc = sa_operator(*criteria).self_group()
 
             # Finalize $nor: negate the result
             # We do it after it's enclosed into parentheses
@@ -275,8 +301,9 @@ def sql_anded_together(conditions: list[sa.sql.ColumnElement]) -> Union[sa.sql.C
     if not conditions:
         return True
 
-    # AND them together
-    cc = sa.and_(*conditions)
+    # A single condition: as is
+    if len(conditions) == 1:
+        return conditions[0]
 
-    # Put parentheses around it, if necessary
-    return cc.self_group() if len(conditions) > 1 else cc
+    # AND them together, put parentheses around
+    return sa.and_(*conditions).self_group()
@@ -65,11 +65,8 @@ class BeforeAfterOperation(Operation):
         # Only one of these can be used, not simultaneously
         before = self.query.before.cursor
         after = self.query.after.cursor
-        if sum([
-            before is not None,
-            after is not None,
-            self.query.skip.skip is not None,
-        ]) > 1:
+        # NOTE: booleans add up as integers
+        if (before is not None) + (after is not None) + (self.query.skip.skip is not None) > 1:
             raise exc.QueryObjectError("Choose a pagination method and use either 'skip', or 'before', or 'after'.")
 
         # Set self.cursor, self.direction
@@ -116,9 +113,17 @@ class BeforeAfterOperation(Operation):
 
 def get_cursor_impl_cls(cursor: str) -> type[CursorImplementation]:
     """ Given a cursor string, get a class that implements it, or fail """
-    if cursor.startswith(SkipCursor.name):
-        return SkipCursor
-    elif cursor.startswith(KeysetCursor.name):
-        return KeysetCursor
-    else:
+    # Cursors look like "<name>:<data>": see encode_opaque_cursor()
+    name, _, _ = cursor.partition(':')
+
+    try:
+        return CURSOR_IMPLEMENTATIONS[name]
+    except KeyError:
         raise NotImplementedError
+
+
+# Cursor implementations, by name: the prefix of every cursor they generate
+CURSOR_IMPLEMENTATIONS: dict[str, type[CursorImplementation]] = {
+    SkipCursor.name: SkipCursor,
+    KeysetCursor.name: KeysetCursor,
+}
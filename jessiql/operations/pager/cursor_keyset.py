@@ -1,11 +1,14 @@
 from __future__ import annotations
-from cgitb import handler
 
 import operator
+from collections import abc
 from dataclasses import dataclass
-from typing import Optional, NamedTuple, TYPE_CHECKING
+from typing import Any, Optional, NamedTuple, Union, TYPE_CHECKING
 
 import sqlalchemy as sa
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql.functions import FunctionElement
 
 from jessiql import exc
 from jessiql.query_object.sort import SortingField
@@ -27,6 +30,13 @@ if TYPE_CHECKING:
     from jessiql.engine.query_executor import QueryExecutor
 
 
+# Cursor operators: `KeysetCursorData.op` => tuple comparison operator
+_COMPARISON_OPERATORS = {
+    '>': operator.gt,
+    '<': operator.lt,
+}
+
+
 class KeysetCursor(CursorImplementation):
     """ Cursor implementation: "keyset". Uses smart keyset pagination to efficiently paginate a query """
     name = 'keys'
@@ -80,7 +90,8 @@ class KeysetCursor(CursorImplementation):
         # TODO: keyset pagination should also support sorting in varied directions!
         #  In this case, however, that nice tuple() expression would have to be replaced with something more complicated.
         #  We can do it!
-        if len({field.direction for field in query.sort.fields}) != 1:
+        first_direction = query.sort.fields[0].direction
+        if not all(field.direction == first_direction for field in query.sort.fields):
             debug and print(f'Keyset n/a: {query.sort.export()=} has varied directions')
             return False
 
@@ -130,40 +141,46 @@ class KeysetCursor(CursorImplementation):
         return PageLinks(prev=prev, next=next)
 
     def apply_to_statement(self, query: QueryObject, target_Model: SAModelOrAlias, stmt: sa.sql.Select) -> sa.sql.Select:
-        # Prepare the filter expression
         cursor = self.cursor_value
 
+        # No cursor: first page. Nothing to filter by, only the limit
         if cursor is None:
-            filter_expression = True
-            limit = self.limit
-        else:
-            # Make sure the columns are still the same
-            if set(cursor.cols) != query.sort.names:
-                raise exc.QueryObjectError('You cannot adjust "sort" fields while using cursor-based pagination.')
-
-            # Filter
-            op = {'>': operator.gt, '<': operator.lt}[cursor.op]
-            filter_expression = op(
-                sa.tuple_(*(
-                    resolve_column_by_name(field.name, target_Model, where='skip')
-                    for field in query.sort.fields
-                )),
-                cursor.val
-            )
-            limit = cursor.limit
+            if self.limit is None:
+                return stmt
+
+            # We will always load one more row to check if there's a next page
+            return stmt.limit(self.limit + 1)
+
+        # Make sure the columns are still the same
+        if cursor.cols != query.sort.ordered_names:
+            raise exc.QueryObjectError('You cannot adjust "sort" fields while using cursor-based pagination.')
 
-        if limit is None:
+        # Cursor without a limit: nothing to paginate
+        if cursor.limit is None:
             return stmt
 
+        # Prepare the filter expression
+        op = _COMPARISON_OPERATORS.get(cursor.op)
+        if op is None:
+            raise exc.QueryObjectError(f'Invalid cursor comparison operator: {cursor.op!r}')
+        filter_expression = KeysetComparison(
+            op,
+            [
+                resolve_column_by_name(field.name, target_Model, where='skip')
+                for field in query.sort.fields
+            ],
+            cursor.val
+        )
+
         # Paginate
         # We will always load one more row to check if there's a next page
-        return stmt_filter(stmt, filter_expression).limit(limit + 1)
+        return stmt_filter(stmt, filter_expression).limit(cursor.limit + 1)
 
     def inspect_data_rows(self, query_executor: QueryExecutor, rows: list[SARowDict]):
         limit = self.cursor_value.limit if self.cursor_value else self.limit
 
         # Columns that participate in keyset pagination
-        column_names = tuple(field.name for field in query_executor.query.sort.fields)
+        column_names = query_executor.query.sort.ordered_names
 
         # Sort direction
         # We can be certain that all sort columns are sorted in the same direction, so we just take the first one
@@ -189,8 +206,16 @@ class KeysetCursor(CursorImplementation):
         has_next_page = len(rows) == expected_count
 
         # Get tuples for the first/last rows
-        first_tuple = tuple(rows[0][k] for k in column_names)
-        last_tuple = tuple(rows[-2][k] for k in column_names) if has_next_page else None
+        # NOTE: itemgetter() with one key returns a scalar, not a tuple. Wrap it.
+        get_values = operator.itemgetter(*column_names)
+        first_tuple: tuple
+        last_tuple: Optional[tuple]
+        if len(column_names) == 1:
+            first_tuple = (get_values(rows[0]),)
+            last_tuple = (get_values(rows[-2]),) if has_next_page else None
+        else:
+            first_tuple = get_values(rows[0])
+            last_tuple = get_values(rows[-2]) if has_next_page else None
 
         # We've loaded one extra row. Now remove it.
         if has_next_page:
@@ -222,19 +247,21 @@ class KeysetCursorData(NamedTuple):
     # The tuple used for keyset pagination
     val: tuple
 
-    def serialize(self) -> dict:
-        return {'limit': self.limit, 'cols': self.cols, 'op': self.op, 'val': self.val}
+    # NOTE: NamedTuple instances already have no __dict__: `__slots__ = ()` is implied and cannot be declared here.
 
     def encode(self) -> str:
-        return encode_opaque_cursor('keys', self.serialize())
+        return encode_opaque_cursor('keys', {'limit': self.limit, 'cols': self.cols, 'op': self.op, 'val': self.val})
 
     @classmethod
-    def decode(cls, cursor: str):
+    def decode(cls, cursor: Union[str, bytes]):
         type, data = decode_opaque_cursor(cursor)
+
+        # JSON has no tuples: convert `cols` back so that it can be compared to SortQuery.ordered_names
+        data['cols'] = tuple(data['cols'])
         return cls(**data)
 
 
-@dataclass
+@dataclass(frozen=True)
 class KeysetPageInfo:
     """ Page info for the "keyset" cursor """
     # Column names that participate in the pagination
@@ -255,6 +282,61 @@ class KeysetPageInfo:
     # Do we have any next page?
     has_next_page: bool
 
+    __slots__ = 'column_names', 'sort_asc', 'first_tuple', 'last_tuple', 'has_prev_page', 'has_next_page'
+
+
+class KeysetComparison(FunctionElement):
+    """ Keyset comparison: (col1, col2, ...) > (val1, val2, ...)
+
+    Most databases support tuple comparison natively. Oracle and SQL Server don't: for them,
+    the comparison is expanded into an equivalent lexicographic OR-expression:
+
+        (c1 > v1) OR (c1 = v1 AND c2 > v2) OR ...
+
+    The dialect is only known at compile time. Only the tuple comparison is built here;
+    the expansion is built by the compiler, and only for the dialects that need it.
+    """
+    # NOTE: SqlAlchemy expects a class-level `type` here, but its type stubs reject the assignment
+    type = sa.Boolean()  # type: ignore[assignment]
+    inherit_cache = True
+
+    def __init__(self, op: abc.Callable[[Any, Any], sa.sql.ColumnElement], columns: abc.Sequence[InstrumentedAttribute], values: abc.Sequence[Any]):
+        super().__init__(op(sa.tuple_(*columns), values))
+
+
+@compiles(KeysetComparison)
+def _compile_keyset_comparison(element: KeysetComparison, compiler, **kw):
+    tuple_comparison, = element.clauses.clauses
+    return compiler.process(tuple_comparison, **kw)
+
+
+@compiles(KeysetComparison, 'oracle')
+@compiles(KeysetComparison, 'mssql')
+def _compile_keyset_comparison_expanded(element: KeysetComparison, compiler, **kw):
+    tuple_comparison, = element.clauses.clauses
+
+    # Take columns, values and the operator from the tuple comparison.
+    # NOTE: reuse its bound parameters rather than make new ones: SqlAlchemy's compiled cache only knows about these
+    op = tuple_comparison.operator
+    columns = _tuple_items(tuple_comparison.left)
+    values = _tuple_items(tuple_comparison.right)
+
+    expanded_comparison = sa.or_(*(
+        sa.and_(
+            *(columns[j] == values[j] for j in range(i)),
+            op(columns[i], values[i]),
+        )
+        for i in range(len(columns))
+    ))
+    return compiler.process(expanded_comparison, **kw)
+
+
+def _tuple_items(expr: sa.sql.ColumnElement) -> list[sa.sql.ColumnElement]:
+    """ Get the items of a tuple_() expression, possibly wrapped in parentheses """
+    if isinstance(expr, sa.sql.elements.Grouping):
+        expr = expr.element
+    return list(expr.clauses)  # type: ignore[attr-defined]
+
 
 def _sorted_by_unique_notnull(field: SortingField) -> bool:
     """ Check that the sorting field `field` is a UNIQUE NOT NULL field """
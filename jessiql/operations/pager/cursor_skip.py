@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, NamedTuple, TYPE_CHECKING
+from typing import Optional, NamedTuple, Union, TYPE_CHECKING
 
 import sqlalchemy as sa
 
@@ -132,21 +132,22 @@ class SkipCursorData(NamedTuple):
     skip: int
     limit: int
 
-    def serialize(self) -> dict:
-        # TODO: more compact names and encoding
-        return {'skip': self.skip, 'limit': self.limit}
+    # NOTE: NamedTuple instances already have no __dict__: `__slots__ = ()` is implied and cannot be declared here.
 
     def encode(self) -> str:
-        return encode_opaque_cursor('skip', self.serialize())
+        # TODO: more compact names and encoding
+        return encode_opaque_cursor('skip', {'skip': self.skip, 'limit': self.limit})
 
     @classmethod
-    def decode(cls, cursor: str):
+    def decode(cls, cursor: Union[str, bytes]):
         type, data = decode_opaque_cursor(cursor)
         return cls(**data)
 
 
-@dataclass
+@dataclass(frozen=True)
 class SkipPageInfo:
     """ Page info for the "skip" cursor """
     # Do we have any next page?
     has_next_page: bool
+
+    __slots__ = 'has_next_page',
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import base64
 import json
+from typing import Union
 
 
 def encode_opaque_cursor(prefix: str, data: dict) -> str:
@@ -9,13 +10,18 @@ def encode_opaque_cursor(prefix: str, data: dict) -> str:
     return prefix + ':' + base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
 
 
-def decode_opaque_cursor(raw_data: str) -> tuple[str, dict]:
+def decode_opaque_cursor(raw_data: Union[str, bytes]) -> tuple[str, dict]:
     """ Decode an opaque cursor into a (prefix, data dict) tuple
 
+    The cursor may be given as bytes: e.g. straight from the HTTP layer. The payload is never
+    converted to `str`: both base64 and json can work with bytes directly.
+
     Raises:
         Exception: all sorts of errors related to bad cursor
     """
-    prefix, data_encoded = raw_data.split(':', 1)  # ValueError
+    raw_bytes: bytes = raw_data.encode() if isinstance(raw_data, str) else raw_data
+    prefix_encoded, data_encoded = raw_bytes.split(b':', 1)  # ValueError
+    prefix = prefix_encoded.decode()
     assert prefix in ('skip', 'keys')  # AssertionError
     data = json.loads(base64.urlsafe_b64decode(data_encoded))  # binascii.Error, json.decoder.JSONDecodeError
     return prefix, data
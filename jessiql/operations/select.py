@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import itertools
 from collections import abc
 from typing import TYPE_CHECKING
 
 import sqlalchemy as sa
 
 from jessiql.query_object import SelectQuery
+from jessiql.sainfo.models import lru_cache_for_models
 from jessiql.sautil.adapt import LeftRelationshipColumnsAdapter
 from jessiql.util.sacompat import add_columns_if_missing
 from jessiql.typing import SAModelOrAlias
 
 from .base import Operation
+from .fields import PropertyHandler
 
 
 if TYPE_CHECKING:
@@ -30,15 +33,18 @@ class SelectOperation(Operation):
         """ Modify the Select statement: add SELECT fields """
         # Add columns to Select
         # This includes our columns and foreign keys for related objects as well!
-        selected_columns = list(self.compile_columns())
-        stmt = add_columns_if_missing(stmt, selected_columns)
+        # NOTE: the columns are streamed into the statement; we only peek at the first one to see if there are any
+        selected_columns = self.compile_columns()
+        first_column = next(selected_columns, None)
 
         # If no columns were selected, use the primary key
         # This is because SQL does not tolerate empty queries.
         # We could have used constant `1`, but where's fun in that :)
-        if not selected_columns:
+        if first_column is None:
             primary_key = sa.orm.class_mapper(self.target_Model).primary_key
             stmt = add_columns_if_missing(stmt, primary_key)
+        else:
+            stmt = add_columns_if_missing(stmt, itertools.chain((first_column,), selected_columns))
 
         # Done
         return stmt
@@ -58,8 +64,28 @@ class SelectOperation(Operation):
         yield from select_local_columns_for_relations(self.query.select, self.target_Model, where='select')
 
     def apply_to_results(self, query_executor: QueryExecutor, rows: list[dict]) -> list[dict]:
+        # Property handlers evaluate row by row.
+        # Consecutive ones are grouped together so that they go over the rows in one pass
+        properties: list[PropertyHandler] = []
+
         for field in self.query.select.fields.values():
-            rows = field.handler.apply_to_results(rows)
+            handler = field.handler
+
+            # Property? Delay.
+            if type(handler) is PropertyHandler:
+                properties.append(handler)
+                continue
+
+            # Other handler: apply delayed properties first, to keep the order
+            if properties:
+                rows = PropertyHandler.apply_many_to_results(properties, rows)
+                properties = []
+
+            rows = handler.apply_to_results(rows)
+
+        if properties:
+            rows = PropertyHandler.apply_many_to_results(properties, rows)
+
         return rows
 
 
@@ -73,8 +99,19 @@ def select_local_columns_for_relations(select: SelectQuery, Model: SAModelOrAlia
     """
     # Go over every relationship
     for relation in select.relations.values():
-        # Prepare to adapt the statement: i.e. rewrite it using aliased table names
-        adapter = LeftRelationshipColumnsAdapter(Model, relation.property)
-
         # Resolve a relationship to a list of columns that should be loaded
-        yield from adapter.replace_many(relation.property.local_columns)
+        yield from _adapted_local_columns(Model, relation.property)
+
+
+# NOTE: only model classes are cached, not aliases: see lru_cache_for_models()
+# Dropped by fields.invalidate_field_caches() when new mappers get configured.
+@lru_cache_for_models(maxsize=1024)
+def _adapted_local_columns(Model: SAModelOrAlias, relation_property: sa.orm.RelationshipProperty) -> tuple[sa.Column, ...]:
+    """ Get relationship's local columns adapted to `Model` (which may be an alias)
+
+    Adapting is a clause traversal: not cheap, yet the result is the same for every query against this model.
+    For aliases, it's done every time.
+    """
+    # Prepare to adapt the statement: i.e. rewrite it using aliased table names
+    adapter = LeftRelationshipColumnsAdapter(Model, relation_property)
+    return tuple(adapter.replace_many(relation_property.local_columns))
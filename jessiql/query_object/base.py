@@ -6,6 +6,7 @@ class OperationInputBase:
 
     Operation's input is basically a parsed field of a Query Object
     """
+    __slots__ = ()
 
     @classmethod
     def from_query_object(cls) -> Any:
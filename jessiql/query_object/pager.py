@@ -17,6 +17,8 @@ class SkipQuery(OperationInputBase):
     # Skip: the number of objects to skip
     skip: Optional[int]
 
+    __slots__ = 'skip',
+
     @classmethod
     def from_query_object(cls, skip: Optional[int]):  # type: ignore[override]
         if skip is None or isinstance(skip, int):
@@ -35,6 +37,8 @@ class LimitQuery(OperationInputBase):
     # Limit: the number of objects to limit the result set to
     limit: Optional[int]
 
+    __slots__ = 'limit',
+
     @classmethod
     def from_query_object(cls, limit: Optional[int]):  # type: ignore[override]
         if limit is None or isinstance(limit, int):
@@ -53,6 +57,8 @@ class BeforeQuery(OperationInputBase):
     # Cursor value for pagination
     cursor: Optional[str]
 
+    __slots__ = 'cursor',
+
     @classmethod
     def from_query_object(cls, cursor: Optional[str]):  # type: ignore[override]
         return cls(cursor=cursor)
@@ -64,3 +70,4 @@ class BeforeQuery(OperationInputBase):
 @dataclass
 class AfterQuery(BeforeQuery):
     """ Query Object operation: the "after" operation """
+    __slots__ = ()
@@ -39,6 +39,11 @@ class SortQuery(OperationInputBase):
         """ Get a set of field names involved in sorting """
         return frozenset(field.name for field in self.fields)
 
+    @cached_property
+    def ordered_names(self) -> tuple[str, ...]:
+        """ Get a tuple of field names involved in sorting, in the sorting order """
+        return tuple(field.name for field in self.fields)
+
     def __contains__(self, field: Union[str, SAAttribute]):
         """ Check if the field used in sorting
 
@@ -26,6 +26,7 @@ except ImportError:
     from functools import lru_cache as cache
 
 from jessiql.sainfo.names import model_name
+from jessiql.sainfo.models import lru_cache_for_models
 from jessiql.typing import SAModelOrAlias, SAAttribute
 from jessiql import exc
 
@@ -36,7 +37,13 @@ def get_column_by_name(field_name: str, Model: SAModelOrAlias) -> Optional[Instr
     return getattr(Model, field_name, None)
 
 
+@lru_cache_for_models(maxsize=4096, model_arg=1)
 def resolve_column_by_name(field_name: str, Model: SAModelOrAlias, *, where: str) -> InstrumentedAttribute:
+    """ Get a column attribute by name, or fail
+
+    Models are static, so the result is memoized for model classes (not aliases): filters and cursors resolve
+    the same columns again and again. Failures are not cached: they raise.
+    """
     # As simple as it looks, this code invokes __getattr__() on sa.orm.AliasedClass which adapts the SQL expression
     # to make sure it uses the proper aliased name in queries
     try:
@@ -1,12 +1,48 @@
+from functools import lru_cache, wraps
+
 import sqlalchemy as sa
 import sqlalchemy.orm
+from sqlalchemy.orm.util import AliasedClass
 
 from jessiql.typing import SAModelOrAlias
 
 
+def lru_cache_for_models(maxsize: int, *, model_arg: int = 0):
+    """ lru_cache() for functions of a Model: only plain model classes are cached, aliases are not
+
+    Model classes are static and few. Aliases are not: `aliased()` may be called for every request.
+    A cached alias would stay alive until evicted, and a fresh one would never hit the cache anyway.
+    So for an aliased class, the function is simply called.
+
+    Args:
+        maxsize: lru_cache() size
+        model_arg: Index of the positional argument that is the Model
+
+    Example:
+        @lru_cache_for_models(maxsize=512)
+        def get_something(Model: SAModelOrAlias):
+            ...
+    """
+    def decorator(func):
+        cached_func = lru_cache(maxsize=maxsize)(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if isinstance(args[model_arg], AliasedClass):
+                return func(*args, **kwargs)
+            return cached_func(*args, **kwargs)
+
+        wrapper.cache_clear = cached_func.cache_clear  # type: ignore[attr-defined]
+        return wrapper
+    return decorator
+
+
+@lru_cache_for_models(maxsize=512)
 def unaliased_class(Model: SAModelOrAlias) -> type:
     """ Get the actual model class; unaliased, if was
 
+    Every field handler calls it, so it's memoized for model classes.
+
     Args:
          Model: model class or AliasedClass
     """
@@ -1,4 +1,5 @@
 from typing import Any
+from collections import abc
 
 from jessiql.typing import saproperty
 
@@ -11,6 +12,18 @@ def evaluate_property_on_dict(prop: saproperty, row: dict) -> Any:
     return prop.fget(GetterDict(row))  # type: ignore[misc]
 
 
+def evaluate_properties_on_dict(props: abc.Iterable[tuple[str, saproperty]], row: dict) -> dict:
+    """ Given a list of (name, @property), evaluate them against a dict and store the results into it
+
+    Same as evaluate_property_on_dict(), but the dict is wrapped only once.
+    NOTE: the wrapper refers to the very same dict: properties evaluated later see values of the earlier ones
+    """
+    obj = GetterDict(row)
+    for name, prop in props:
+        row[name] = prop.fget(obj)  # type: ignore[misc]
+    return row
+
+
 class GetterDict:
     """ A thin wrapper that makes a dict behave like an object in terms of attribute access """
     def __init__(self, d: dict):
@@ -1,24 +1,28 @@
+from functools import lru_cache
 from typing import Optional
-from collections import abc
 
 import sqlalchemy as sa
 
 from jessiql.typing import SAAttribute
 
 
+@lru_cache(maxsize=4096)
 def parse_dot_notation(input: str) -> tuple[str, Optional[tuple[str, ...]]]:
     """ Parse dot-notation
 
+    The result is immutable and depends on the input only, so it's memoized:
+    the same field names come again and again with every request, and they'll share the same `sub_path` tuples.
+
     Example:
         parse_dot_notation('a') #-> 'a', None
-        parse_dot_notation('a.b.c') #-> 'a', ['b', 'c']
+        parse_dot_notation('a.b.c') #-> 'a', ('b', 'c')
     """
     name, _, sub_path_str = input.partition('.')
     sub_path = tuple(sub_path_str.split('.')) if sub_path_str else None
     return name, sub_path
 
 
-def json_field_subpath(expr: SAAttribute, sub_path: abc.Iterable[str]) -> sa.sql.elements.BinaryExpression:
+def json_field_subpath(expr: SAAttribute, sub_path: tuple[str, ...]) -> sa.sql.elements.BinaryExpression:
     """ Return an expression that represents JSON object sub-path accessor
 
     Example:
@@ -29,7 +33,7 @@ def json_field_subpath(expr: SAAttribute, sub_path: abc.Iterable[str]) -> sa.sql
     return expr[sub_path]  # type: ignore[index,return-value]  # TODO: (tag:postgres-only) this expression is only supported by PostgreSQL
 
 
-def json_field_subpath_as_text(expr: SAAttribute, sub_path: abc.Iterable[str]) -> sa.sql.elements.BinaryExpression:
+def json_field_subpath_as_text(expr: SAAttribute, sub_path: tuple[str, ...]) -> sa.sql.elements.BinaryExpression:
     """ Return an expression that represents JSON object sub-path accessor, as TEXT
 
     Example:
@@ -18,3 +18,34 @@ def collecting(func):
             func(*args, **kwargs)
         )
     return wrapper
+
+
+def memoize_by_identity(func):
+    """ Memoize a function by the identity of its first argument
+
+    Use it with long-lived objects that are not hashable, or are expensive to hash:
+    for instance, GraphQL schema definitions. Never use it with per-request objects: the cache is not bounded.
+
+    The cache keeps a reference to the object, so its id() is never reused while it's cached.
+    Other arguments must be hashable.
+
+    Example:
+        @memoize_by_identity
+        def is_special(field_def: graphql.GraphQLField) -> bool:
+            ...
+    """
+    cache: dict = {}
+
+    @wraps(func)
+    def wrapper(obj, *args):
+        key = (id(obj), *args)
+
+        try:
+            return cache[key][1]
+        except KeyError:
+            value = func(obj, *args)
+            cache[key] = (obj, value)
+            return value
+
+    wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+    return wrapper
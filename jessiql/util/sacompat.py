@@ -45,14 +45,15 @@ def add_columns(stmt: sa.sql.Select, columns: abc.Iterable[Union[sa.Column, sa.s
     return stmt
 
 
-def stmt_filter(stmt: sa.sql.Select, *conditions: sa.sql.ClauseElement) -> sa.sql.Select:
-    """ Filter an SqlAlchemy statement """
-    if SA_13:
-        stmt = stmt.where(sa.and_(*conditions))
-    else:
-        stmt = stmt.filter(*conditions)
-
-    return stmt
+# NOTE: the version is checked once, at import time: this function is called for every query
+if SA_13:
+    def stmt_filter(stmt: sa.sql.Select, *conditions: sa.sql.ClauseElement) -> sa.sql.Select:
+        """ Filter an SqlAlchemy statement """
+        return stmt.where(sa.and_(*conditions))
+else:
+    def stmt_filter(stmt: sa.sql.Select, *conditions: sa.sql.ClauseElement) -> sa.sql.Select:
+        """ Filter an SqlAlchemy statement """
+        return stmt.filter(*conditions)
 
 
 try:
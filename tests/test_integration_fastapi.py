@@ -33,6 +33,7 @@ def query(**fields):
     ('?sort=["a","b%2B","c-"]', query(sort=['a+', 'b+', 'c-'])),
     ('?filter={"age":{"$gt":18}}', query(filter={'age': {'$gt': 18}})),
     ('?skip=1&limit=2', query(skip=1, limit=2)),
+    ('?after=cursor', query(after='cursor')),
 ])
 def test_query_object_parameter(app: FastAPI, client: TestClient, uri_params: str, expected_result: Optional[dict]):
     """ FastAPI: get Query Object as URL parameters """
@@ -191,6 +191,31 @@ def query(**fields):
                 }
             }
         ),
+    # Test: JessiQL nested query with a fragment: runtime type of a sub-query is inferred from the schema
+    (
+        ''' query {
+            object {
+                id query
+                object { ...ModelFields }
+            }
+        }
+        fragment ModelFields on Model { id }
+        ''',
+        {},
+        {
+            'object': {
+                'id': '1',
+                'query': query(
+                    select=['id', 'query'],
+                    join={
+                        'object': query(
+                            select=['id'])}),
+                'object': {
+                    'id': '1',
+                },
+            }
+        }
+    ),
     # Test: does not fail when a non-null parameter is present
     # get_query_argument_name_for() used to fail because it didn't un-wrap wrapper types like NonNull
     (
@@ -3,10 +3,11 @@ import sqlalchemy as sa
 import sqlalchemy.ext.hybrid
 from sqlalchemy.dialects import postgresql as pg
 
-from jessiql import QueryObjectDict
+from jessiql import QueryObjectDict, Query
 from jessiql.sainfo.version import SA_14
 from jessiql.testing.table_data import insert
 from jessiql.testing.recreate_tables import created_tables
+from jessiql.testing.stmt_text import stmt2sql
 from jessiql.util import sacompat
 
 from .util.models import IdManyFieldsMixin, id_manyfields
@@ -60,6 +61,9 @@ from .util.test_queries import typical_test_sql_query_text, typical_test_query_r
     # Filter a relationship
     (dict(filter={'related.a': 'a'}), ["WHERE EXISTS", "SELECT 1", "FROM r", "WHERE a.id = r.parent_id AND r.a = a"]),
     (dict(filter={'related.parent.a': 'a'}), ["WHERE EXISTS", "SELECT 1", "FROM r", "WHERE a.id = r.parent_id AND (EXISTS", "SELECT 1", "FROM a", "WHERE a.id = r.parent_id AND a.a = a"]),
+    # Empty boolean expressions are left out
+    (dict(filter={'$or': [{'$and': []}], 'a': 1}), ["WHERE a.a = 1"]),
+    (dict(filter={'$or': [{'$nor': []}, {'a': 1}, {'b': 2}]}), ["a.a = 1 OR a.b = 2"]),
 ])
 def test_filter_sql(connection: sa.engine.Connection, query_object: QueryObjectDict, expected_query_lines: list[str]):
     """ Typical test: what SQL is generated """
@@ -92,6 +96,25 @@ def test_filter_sql(connection: sa.engine.Connection, query_object: QueryObjectD
     typical_test_sql_query_text(query_object, Model, expected_query_lines)
 
 
+@pytest.mark.parametrize('filter', [
+    {'$and': []},
+    {'$or': []},
+    {'$nor': []},
+    {'$and': [{'$or': []}, {'$nor': []}]},
+])
+def test_filter_empty_boolean_sql(filter: dict):
+    """ Test: empty $and, $or, $nor add no WHERE clause """
+    # Models
+    Base = sacompat.declarative_base()
+
+    class Model(IdManyFieldsMixin, Base):
+        __tablename__ = 'a'
+
+    # Test
+    sql = stmt2sql(Query(dict(filter=filter), Model).statement())
+    assert 'WHERE' not in sql
+
+
 @pytest.mark.parametrize(('query_object', 'expected_results'), [
     # Empty input
     (dict(), [{'id': n} for n in (1, 2, 3)]),
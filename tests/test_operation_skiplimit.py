@@ -1,6 +1,8 @@
+import operator
+
 import pytest
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql as pg
+from sqlalchemy.dialects import postgresql as pg, mssql, oracle
 
 import jessiql
 from jessiql import QueryObjectDict
@@ -9,6 +11,7 @@ from jessiql.testing.table_data import insert
 from jessiql.testing.recreate_tables import created_tables
 from jessiql.util import sacompat
 from jessiql.operations.pager.cursor_skip import SkipCursorData
+from jessiql.operations.pager.cursor_keyset import KeysetComparison
 from jessiql.operations.pager.util import decode_opaque_cursor
 
 from .util.models import IdManyFieldsMixin, id_manyfields
@@ -165,6 +168,11 @@ def test_skiplimit_cursor_pagination(connection: sa.engine.Connection):
         assert decode_links(q.page_links()) == (None,
                                                 dict(skip=2, limit=2))
 
+        # Test: prefetch. Have next page => called once, with the "next" cursor
+        prefetched = []
+        links = q.page_links(prefetch=prefetched.append)
+        assert prefetched == [links.next]
+
         # Test: next page
         # Have both prev & next pages
         q, res = load(select=['id'], sort=['a'], after=q.page_links().next)
@@ -180,6 +188,11 @@ def test_skiplimit_cursor_pagination(connection: sa.engine.Connection):
         assert decode_links(q.page_links()) == (dict(skip=2, limit=2),
                                                 None)
 
+        # Test: prefetch. Last page => not called
+        prefetched = []
+        q.page_links(prefetch=prefetched.append)
+        assert prefetched == []
+
         # Test: prev page
         q, res = load(select=['id'], sort=['a'], before=q.page_links().prev)
 
@@ -318,3 +331,29 @@ def decode_links(links: jessiql.PageLinks) -> tuple[dict, dict]:
         decode_opaque_cursor(links.prev)[1] if links.prev else None,
         decode_opaque_cursor(links.next)[1] if links.next else None,
     )
+
+
+def test_keyset_comparison_dialects():
+    """ Test keyset comparison: tuple comparison where supported, OR-expansion elsewhere """
+    # Models
+    Base = sacompat.declarative_base()
+
+    class Model(IdManyFieldsMixin, Base):
+        __tablename__ = 'a'
+
+    # Expression
+    expr = KeysetComparison(operator.gt, [Model.a, Model.id], ['u-1-a', 1])
+
+    # Postgres: tuple comparison
+    sql = str(expr.compile(dialect=pg.dialect()))
+    assert sql.startswith('(a.a, a.id) > ')
+
+    # SQL Server, Oracle: OR-expansion
+    for dialect in (mssql.dialect(), oracle.dialect()):
+        compiled = expr.compile(dialect=dialect)
+        sql = str(compiled)
+        assert '(a.a, a.id)' not in sql
+        assert ' OR ' in sql and ' AND ' in sql
+
+        # Same values are bound: the expansion reuses parameters of the tuple comparison
+        assert sorted(map(str, compiled.params.values())) == ['1', 'u-1-a']